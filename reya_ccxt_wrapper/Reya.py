@@ -29,53 +29,269 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import calendar
+import functools
 import json
 import math
+import re
+import sys
+import threading
 import time
 from datetime import datetime
 from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
 from io import UnsupportedOperation
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, ClassVar
 
 from ccxt.base.types import Str, Int, FundingRate, OrderSide, Num, Strings
+from requests.adapters import HTTPAdapter
 
 from reya_ccxt_wrapper.abstract.Reya import ImplicitAPI
 from reya_ccxt_wrapper.const import EOrderSide, EOrderStatus, EOrderType
 from sdk.open_api import CreateOrderResponse, TimeInForce, CancelOrderResponse, OrderType
 from sdk.reya_rest_api import ReyaTradingClient
-from sdk.reya_rest_api.config import REYA_DEX_ID
 from sdk.reya_rest_api.models import TriggerOrderParameters, LimitOrderParameters
+from sdk.reya_websocket import ReyaSocket
 
 try:
     import ccxt  # type: ignore
 except Exception as e:
     raise RuntimeError("ccxt is required. Install with: pip install ccxt") from e
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional C encoder, stdlib json is used otherwise
+    orjson = None
+
+try:
+    import ciso8601  # type: ignore
+except ImportError:  # optional C parser for timestamps outside the fixed UTC shape
+    ciso8601 = None
+
+_PATH_PARAM_RE = re.compile(r"\{(\w+)\}")
+
+
+def _json_default(value):
+    # only called for values the encoder does not know natively
+    if hasattr(value, "value"):  # likely an Enum
+        return value.value
+    return str(value)  # last-resort: stringify
+
+
+def _json_dumps(obj) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_json_default).decode()
+        except TypeError:
+            # orjson rejects ints wider than 64 bits (order nonces) and non-str dict keys, stdlib json does not
+            pass
+    return json.dumps(obj, default=_json_default)
+
+
+@functools.lru_cache(maxsize=None)
+def _path_template(path: str) -> tuple:
+    # "v2/prices/{symbol}" -> (("v2/prices/", None), ("", "symbol")); parsed once per endpoint path
+    parts = []
+    pos = 0
+    for match in _PATH_PARAM_RE.finditer(path):
+        parts.append((path[pos:match.start()], match.group(1)))
+        pos = match.end()
+    parts.append((path[pos:], None))
+    return tuple(parts)
+
+
+def _fill_path(path: str, params: Dict) -> str:
+    # substitutes the path placeholders found in params and pops them, unknown placeholders are kept as-is
+    out = []
+    for literal, name in _path_template(path):
+        out.append(literal)
+        if name is not None:
+            out.append(str(params.pop(name)) if name in params else "{" + name + "}")
+    return "".join(out)
+
 
 def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
+_DEPOSIT_ADDRESS_PATH = "api/trading/wallet/%s/deposit-address"
+_WITHDRAW_PATH = "api/trading/wallet/withdraw"
+
+_CCXT_SUFFIX = "/RUSD:RUSD"
+_REYA_SUFFIX = "RUSDPERP"
+
+_SELL = EOrderSide.SELL.value
+_MARKET = EOrderType.MARKET.value
+# raw API codes -> ccxt values, anything unknown falls back to sell / market
+_SIDE_BY_RAW = {"B": EOrderSide.BUY.value, "A": _SELL}
+_TYPE_BY_RAW = {"LIMIT": EOrderType.LIMIT.value}
+# ccxt side -> is_buy of the SDK order parameters, other spellings fall back to side.lower()
+_SIDE_IS_BUY = {"buy": True, "sell": False, "BUY": True, "SELL": False, "Buy": True, "Sell": False}
+
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+_loop_thread_id: Optional[int] = None
+
+
+def _run_loop_forever(loop: asyncio.AbstractEventLoop) -> None:
+    global _loop_thread_id
+    _loop_thread_id = threading.get_ident()
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+
+def _stop_background_loop() -> None:
+    # interpreter shutdown: stop the loop from its own thread so pending callbacks are not cut off mid-run
+    loop = _LOOP
+    if loop is not None and loop.is_running():
+        loop.call_soon_threadsafe(loop.stop)
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_run_loop_forever, args=(_LOOP,), name="reya-ccxt-loop", daemon=True).start()
+            atexit.register(_stop_background_loop)
+    return _LOOP
+
+
 def run_async(coro):
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        # no loop exists, create one
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-    if loop.is_running():
-        # already inside an async loop → create a blocking task
-        future = asyncio.ensure_future(coro)
-        # run_until_complete cannot be called if loop is running,
-        # so we have to use nest_asyncio or similar in that case
-        import nest_asyncio
-        nest_asyncio.apply()
-        return loop.run_until_complete(future)
+    # All SDK coroutines run on one long-lived loop in a daemon thread. This keeps the SDK's
+    # aiohttp connection pool alive between calls and works whether or not the caller is
+    # already inside a running event loop (no nest_asyncio patching needed).
+    loop = _background_loop()
+    if _loop_thread_id == threading.get_ident():
+        # blocking on the loop from its own thread would never return
+        coro.close()
+        raise RuntimeError("run_async() called from the Reya background loop, await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+# fan-out calls get their own pool instead of the background loop's default executor
+_fanout_state = threading.local()
+
+
+def _mark_fanout_worker() -> None:
+    _fanout_state.worker = True
+
+
+_FANOUT_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="reya-ccxt-fanout",
+                                      initializer=_mark_fanout_worker)
+
+
+async def _gather_threaded(*calls, limit: Optional[int] = None):
+    # run independent blocking ccxt calls concurrently (at most `limit` at once), results keep the order of `calls`
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def run(call):
+        if semaphore is None:
+            return await loop.run_in_executor(_FANOUT_EXECUTOR, call)
+        async with semaphore:
+            return await loop.run_in_executor(_FANOUT_EXECUTOR, call)
+
+    return await asyncio.gather(*(run(call) for call in calls))
+
+
+def _run_threaded(*calls, limit: Optional[int] = None) -> list:
+    # a call that already runs in a fan-out worker (e.g. fetch_tickers inside fetch_position) runs its own
+    # fan-out inline: waiting on a nested fan-out could block on workers held by the outer one
+    if getattr(_fanout_state, "worker", False):
+        return [call() for call in calls]
+    return run_async(_gather_threaded(*calls, limit=limit))
+
+
+@functools.lru_cache(maxsize=4096)
+def _minute_epoch_ms(minute: str) -> int:
+    # "YYYY-MM-DDTHH:MM" -> epoch ms, trades of one page mostly share a handful of minutes
+    return calendar.timegm((int(minute[0:4]), int(minute[5:7]), int(minute[8:10]),
+                            int(minute[11:13]), int(minute[14:16]), 0)) * 1000
+
+
+@functools.lru_cache(maxsize=8192)
+def _ms_to_iso8601(ts: Optional[int]) -> Optional[str]:
+    # rows of one orders / trades page share many millisecond timestamps, format each one once
+    return ccxt.Exchange.iso8601(ts)
+
+
+def _iso8601_to_ms(ts: str) -> int:
+    # fixed "YYYY-MM-DDTHH:MM:SS[.sss]Z" shape is sliced directly, anything else goes through fromisoformat
+    if len(ts) >= 20 and ts[10] == "T" and ts[-1] == "Z":
+        millis = int((ts[20:-1] + "000")[:3]) if ts[19] == "." else 0
+        return _minute_epoch_ms(ts[:16]) + int(ts[17:19]) * 1000 + millis
+    if ciso8601 is not None:
+        dt = ciso8601.parse_datetime(ts)
     else:
-        return loop.run_until_complete(coro)
+        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    return int(dt.timestamp() * 1000)
+
+
+def _timestamp_ms(value) -> int:
+    # v2 endpoints send epoch ms, older ones ISO8601 strings (the "Z" means UTC)
+    if value is None or value == "":
+        return _now_ms()
+    if isinstance(value, (int, float)):
+        return int(value)
+    if value.isdigit():
+        return int(value)
+    return _iso8601_to_ms(value)
+
+
+def _used_margin(open_orders, leverages: Dict[str, int], default_leverage: int = 3) -> float:
+    # margin reserved by open orders: sum(amount * price / leverage) over (amount, price, symbol) rows,
+    # reduced in one generator pass
+    return math.fsum(
+        float(amount) * float(price) / leverages.get(symbol, default_leverage)
+        for amount, price, symbol in open_orders
+    )
+
+
+def _position_metrics(qtys: List[float], marks: List[float], avg_entries: List[float], fundings: List[float],
+                      leverages: List[float], last_prices: List[Optional[float]]):
+    # column-wise over all positions of a fetch_position call; negative funding is charged against the pnl
+    pnls = [
+        qty * (mark - avg) + funding if funding < 0 else qty * (mark - avg)
+        for qty, mark, avg, funding in zip(qtys, marks, avg_entries, fundings)
+    ]
+    liquidation_prices = [avg * (1 - 1 / leverage) for avg, leverage in zip(avg_entries, leverages)]
+    notionals = [
+        qty * last if qty is not None and last is not None else None
+        for qty, last in zip(qtys, last_prices)
+    ]
+    return pnls, liquidation_prices, notionals
+
+
+def _first_present(raw: Dict, key1: str, key2: str):
+    value = raw.get(key1)
+    return raw.get(key2) if value is None or value == "" else value
+
+
+def _market_id_num(market_id: str) -> Optional[int]:
+    return int(market_id) if market_id.isdigit() else None
+
+
+def _matches_market_id(row: Dict, market_id: Optional[str], market_id_num: Optional[int]) -> bool:
+    # rows carry market_id or marketId, as int or str; market_id is the string id of the markets table and
+    # market_id_num its int form, so int ids compare without a str() per row
+    value = row.get('market_id') or row.get('marketId')
+    if value is None:
+        return False
+    if value.__class__ is int:
+        return value == market_id_num
+    return str(value) == market_id
+
+
+def _float_or_none(value) -> Optional[float]:
+    return None if value is None or value == "" else float(value)
+
 
 class Reya(ccxt.Exchange, ImplicitAPI):
+    _binance_delegate: ClassVar[Optional[Any]] = None
+    _binance_delegate_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def describe(self) -> Dict[str, Any]:
         return self.deep_extend(super(Reya, self).describe(), {
             "id": "reya",
@@ -92,7 +308,9 @@ class Reya(ccxt.Exchange, ImplicitAPI):
                 "fetchTrades": True,
                 "fetchBalance": True,
                 "createOrder": True,
+                "createOrders": True,
                 "cancelOrder": True,
+                "cancelOrders": True,
                 "fetchOrder": True,
                 "fetchOrders": True,
                 "fetchOpenOrders": True,
@@ -158,12 +376,62 @@ class Reya(ccxt.Exchange, ImplicitAPI):
                 "account_id": None,
                 # control fetch_tickers concurrency (batch size). None -> full parallel
                 "tickers_batch_size": None,
+                # seconds after a markets (re)load during which load_markets(reload=True) keeps the loaded markets
+                "markets_ttl": 30,
+                # seconds a fetched leverages snapshot is reused before hitting the API again,
+                # set_leverage() drops it earlier
+                "leverages_ttl": 60,
+                # seconds a market summary (funding rate) is reused per symbol
+                "funding_rate_ttl": 5,
+                # seconds an open orders response is shared by back-to-back fetch_* calls
+                "open_orders_ttl": 0.25,
+                # size of the keep-alive connection pool shared by concurrent requests
+                "http_pool_size": 32,
+                # seconds a price pushed by watch_prices() is served instead of a REST call
+                "price_stream_max_age": 2,
+                # seconds a bulk v2/prices response also answers single-symbol fetch_ticker calls
+                "prices_ttl": 0.5,
+                # seconds an order state pushed by watch_order_changes() is served instead of a REST call
+                "order_stream_max_age": 5,
+                # seconds the wallet accounts are reused by fetch_accounts
+                "accounts_ttl": 10,
+                # max. cancel requests cancel_orders() keeps in flight at once
+                "cancel_concurrency": 8,
             },
         })
 
     def __init__(self, config: Dict[str, Any] = {}):
+        # set before super().__init__, which calls set_markets when config carries markets
+        self._markets_by_symbol_or_id: Dict[str, Dict[str, Any]] = {}
+        self._market_ids_by_symbol: Dict[str, tuple] = {}
+        self._markets_loaded_at = 0.0
+        self._throttle_lock = threading.Lock()
         super().__init__(config)
         self.client: ReyaTradingClient = ReyaTradingClient()
+        self.lev_map: Dict[str, int] = {}
+        self._lev_cache: Dict[str, Any] = {"data": None, "ts": 0.0}
+        self._funding_summary_cache: Dict[str, Dict[str, Any]] = {}
+        self._open_orders_cache: Dict[str, Any] = {"data": None, "ts": 0.0}
+        self._prices_cache: Dict[str, Any] = {"data": None, "ts": 0.0}
+        self._accounts_cache: Dict[str, Any] = {"data": None, "ts": 0.0}
+        self._price_socket: Optional[ReyaSocket] = None
+        self._streamed_prices: Dict[str, Dict[str, Any]] = {}
+        self._order_socket: Optional[ReyaSocket] = None
+        self._streamed_orders: Dict[str, Dict[str, Any]] = {}
+        if self.session is not None:
+            # concurrent fan-outs (fetch_balance, fetch_tickers) reuse keep-alive connections instead of
+            # discarding them once requests' default pool of 10 is exhausted
+            pool_size = self.safe_integer(self.options, 'http_pool_size', 32)
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+    def throttle(self, cost=None):
+        # fan-out workers share one rate limit: check and reserve the request slot under one lock, otherwise
+        # concurrent calls all read the same stale lastRestRequestTimestamp and go out at once
+        with self._throttle_lock:
+            super().throttle(cost)
+            self.lastRestRequestTimestamp = self.milliseconds()
 
     # -------------------
     # Signing: call SDK signer only for private endpoints, TODO right now not working good
@@ -175,27 +443,16 @@ class Reya(ccxt.Exchange, ImplicitAPI):
         """
         params = params or {}
         headers = headers or {}
-        url = self.urls["api"][api] + "/" + path.lstrip("/")
+        # replace placeholders in path, e.g. /prices/{symbol}, and drop them from params
+        url = self.urls["api"][api] + "/" + _fill_path(path.lstrip("/"), params)
 
         if api == "public":
-            # replace placeholders in path, e.g. /prices/{symbol}
-            used_keys = []
-            for k, v in params.items():
-                placeholder = "{" + k + "}"
-                if placeholder in url:
-                    url = url.replace(placeholder, str(v))
-                    used_keys.append(k)
-
-            # remove used params
-            for k in used_keys:
-                params.pop(k, None)
-
             if method == "GET":
                 if params:
                     url += "?" + self.urlencode(params)
                 body = None
             else:
-                body = self.json(params) if params else None
+                body = _json_dumps(params) if params else None
                 headers["Content-Type"] = "application/json"
 
             return {
@@ -209,18 +466,19 @@ class Reya(ccxt.Exchange, ImplicitAPI):
         signer = self.safe_value(self.options, 'signer')
         # Accept either callable or object with sign_order(payload, path, method)
         payload = params or {}
-        if body is not None:
+        if isinstance(body, dict):
+            # caller passed the payload itself, no serialize / parse round-trip needed
+            payload = body
+        elif body is not None:
             # if body was set by caller, prefer that
             try:
                 payload = json.loads(body)
             except Exception:
                 payload = body
-        # Include account_id / wallet_address defaulting to options
+        # Include account_id defaulting to options
         account_id = self.safe_value(self.options, "account_id")
-        wallet_address = self.walletAddress
-        if isinstance(payload, dict):
-            if account_id and 'accountId' not in payload and 'account_id' not in payload and 'accountId' not in payload:
-                payload.setdefault('accountId', account_id)
+        if isinstance(payload, dict) and account_id and 'accountId' not in payload and 'account_id' not in payload:
+            payload['accountId'] = account_id
         # signer returns additional headers required by Reya (signature, timestamp, etc)
         headers.update({'Content-Type': 'application/json'})
         if signer is None:
@@ -239,36 +497,27 @@ class Reya(ccxt.Exchange, ImplicitAPI):
         if not isinstance(extra_payload, dict):
             raise TypeError("Signer must return a dict of headers.")
         payload.update(extra_payload)
-        body = json.dumps(self.make_json_safe(payload)) if isinstance(payload, dict) else payload
-        url = self.urls['api'][api] + '/' + path.lstrip('/')
+        body = _json_dumps(payload) if isinstance(payload, dict) else payload
         return {"url": url, "method": method, "body": body, "headers": headers}
 
-    def make_json_safe(self, d):
-        safe = {}
-        for k, v in d.items():
-            if isinstance(v, (str, int, float, bool, type(None), list, dict)):
-                safe[k] = v
-            elif hasattr(v, "value"):  # likely an Enum
-                safe[k] = v.value
-            else:
-                safe[k] = str(v)  # last-resort: stringify
-        return safe
-
     # -------------------
     # Helpers for parsing / mapping
     # -------------------
     def parse_ticker(self, raw: Dict[str, Any]) -> Dict[str, Any]:
-        ts = self.safe_integer(raw, 'timestamp', self.milliseconds())
+        get = raw.get
+        ts = self.safe_integer(raw, 'timestamp')
+        if ts is None:
+            ts = _now_ms()
 
         return {
             "timestamp": ts,
             "datetime": self.iso8601(ts),
-            "high": self.safe_float(raw, 'high'),
-            "low": self.safe_float(raw, 'low'),
-            "bid": self.safe_float(raw, 'best_bid'),
-            "ask": self.safe_float(raw, 'best_ask'),
-            "last":self.safe_float(raw, 'poolPrice', 'price'),
-            "baseVolume": self.safe_float(raw, 'volume', 'last24hVolume'), #todo from other endpoint
+            "high": _float_or_none(get('high')),
+            "low": _float_or_none(get('low')),
+            "bid": _float_or_none(get('best_bid')),
+            "ask": _float_or_none(get('best_ask')),
+            "last": _float_or_none(_first_present(raw, 'poolPrice', 'price')),
+            "baseVolume": _float_or_none(_first_present(raw, 'volume', 'last24hVolume')), #todo from other endpoint
             "info": raw,
         }
 
@@ -284,67 +533,79 @@ class Reya(ccxt.Exchange, ImplicitAPI):
     #     }
 
     def parse_trade(self, raw: Dict[str, Any]) -> Dict[str, Any]:
-        ts = self.safe_string(raw, 'timestamp')
-        if ts is None:
-            ts = _now_ms()
-        else:
-            # Parse ISO8601 (the "Z" means UTC)
-            dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            # Milliseconds since epoch
-            ts = int(dt.timestamp() * 1000)
-
-        side = None
-        if "side" in raw and raw.get("side") == "B":
-            side = EOrderSide.BUY.value
-        else:
-            side = EOrderSide.SELL.value
-
-        amount = self.safe_number_2(raw, 'qty', 'amount')
-
-        price = self.safe_number(raw, 'price')
-
-        return {
-            "id": self.safe_string_2(raw, 'trade_id', 'id'),
-            "timestamp": ts,
-            "datetime": self.iso8601(ts),
-            "symbol": self.safe_string_2(raw, 'symbol', 'ticker'),
-            "price": price,
-            "amount": amount,
-            "side": side,
-            "info": raw,
-            "status": EOrderStatus.CLOSED.value
-        }
+        return self.parse_trades_bulk([raw])[0]
+
+    def parse_trades_bulk(self, raws: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # single pass over e.g. a perpExecutions page: lookups hoisted out of the loop, plain dict.get
+        # instead of safe_* per field and no datetime objects for the timestamps
+        iso8601 = _ms_to_iso8601
+        side_by_raw = _SIDE_BY_RAW
+        closed = EOrderStatus.CLOSED.value
+        out = []
+        for raw in raws:
+            get = raw.get
+            ts = _timestamp_ms(get('timestamp'))
+            trade_id = _first_present(raw, 'trade_id', 'id')
+            out.append({
+                "id": None if trade_id is None else str(trade_id),
+                "timestamp": ts,
+                "datetime": iso8601(ts),
+                "symbol": _first_present(raw, 'symbol', 'ticker'),
+                "price": _float_or_none(get('price')),
+                "amount": _float_or_none(_first_present(raw, 'qty', 'amount')),
+                "side": side_by_raw.get(get("side"), _SELL),
+                "info": raw,
+                "status": closed
+            })
+        return out
 
-    def parse_order(self, raw: Dict[str, Any]) -> Dict[str, Any]:
-        ts = self.safe_integer_2(raw, 'creation_timestamp_ms', 'created_at', _now_ms())
-        if "side" in raw and raw.get("side") == "B":
-            side = EOrderSide.BUY.value
-        else:
-            #Value A = Ask/Sell
-            side = EOrderSide.SELL.value
-        if "orderType" in raw and raw.get("orderType") == "LIMIT":
-            type = EOrderType.LIMIT.value
+    def parse_orders_bulk(self, raws: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # rows without a creation time are stamped with one shared "now", read and formatted once per page
+        now_ms = _now_ms()
+        now = (now_ms, self.iso8601(now_ms))
+        parse = self.parse_order
+        return [parse(raw, now) for raw in raws]
+
+    def parse_order(self, raw: Dict[str, Any], now: Optional[tuple] = None) -> Dict[str, Any]:
+        # safe_integer_2 also takes "1747927089946.0" and float stamps, unparseable values count as missing
+        ts = self.safe_integer_2(raw, 'creation_timestamp_ms', 'created_at')
+        if ts is not None:
+            dt = _ms_to_iso8601(ts)
+        elif now is not None:
+            ts, dt = now
         else:
-            type = EOrderType.MARKET.value
+            ts = _now_ms()
+            dt = self.iso8601(ts)
+        # Value A = Ask/Sell
+        side = _SIDE_BY_RAW.get(raw.get("side"), _SELL)
+        type = _TYPE_BY_RAW.get(raw.get("orderType"), _MARKET)
 
-        symbol = self.safe_string_2(raw, 'symbol', 'ticker')
-        symbol = self.convertSymbolToCcxtNotation(symbol)
+        symbol = self.convertSymbolToCcxtNotation(_first_present(raw, 'symbol', 'ticker'))
 
         raw['order_type'] = type
 
         status = raw.get('status').lower()
+        qty = raw.get('qty') or 0
+        exec_qty = raw.get('execQty') or 0
+        if exec_qty == 0 or exec_qty == "0":
+            # most open orders are unfilled, nothing to subtract
+            remaining = str(qty)
+        else:
+            # decimal strings are subtracted exactly, float math would leak e.g. 0.30000000000000004
+            remaining = str(Decimal(str(qty)) - Decimal(str(exec_qty)))
+        order_id = _first_present(raw, 'order_id', 'orderId')
         return {
-            "id": self.safe_string_2(raw, 'order_id', 'orderId'),
+            "id": None if order_id is None else str(order_id),
             "timestamp": ts,
-            "datetime": self.iso8601(ts),
+            "datetime": dt,
             "status": status,
             "symbol": symbol,
             "type": type,
             "side": side,
-            "price": self.safe_value_2(raw, 'limitPx', 'triggerPx'),
-            "amount": self.safe_value(raw, 'qty', 0),
-            "filled": self.safe_value(raw, 'execQty', 0),
-            "remaining": str(float(self.safe_value(raw, 'qty', 0)) - float(self.safe_value(raw, 'execQty', 0))),
+            "price": _first_present(raw, 'limitPx', 'triggerPx'),
+            "amount": qty,
+            "filled": exec_qty,
+            "remaining": remaining,
             "info": raw,
         }
 
@@ -361,19 +622,60 @@ class Reya(ccxt.Exchange, ImplicitAPI):
     #     self.markets_by_id = self.markets
     #     return self.markets
 
+    def set_markets(self, markets, currencies=None):
+        result = super().set_markets(markets, currencies)
+        # symbol or market id -> market, so order placement resolves a market with one dict lookup
+        index = {}
+        # symbol -> (string, int) form of the market id, resolved once here instead of per filter call
+        ids_by_symbol = {}
+        for market in self.markets.values():
+            market_id = market.get('id') or market.get('market_id')
+            market_id_str = None if market_id is None else str(market_id)
+            ids_by_symbol[market['symbol']] = (
+                market_id_str, None if market_id_str is None else _market_id_num(market_id_str))
+            index[str(market['id'])] = market
+            index[market['symbol']] = market
+        self._markets_by_symbol_or_id = index
+        self._market_ids_by_symbol = ids_by_symbol
+        self._markets_loaded_at = time.monotonic()
+        return result
+
+    def load_markets(self, reload=False, params={}):
+        # market definitions change rarely: a reload shortly after the last (re)load keeps the markets in memory
+        if reload and self.markets and time.monotonic() - self._markets_loaded_at < self.safe_number(self.options, 'markets_ttl', 0):
+            reload = False
+        return super().load_markets(reload, params)
+
+    def _ensure_markets(self) -> None:
+        # hot paths (order placement) only read the index, load_markets runs once when it is still empty
+        if not self._markets_by_symbol_or_id:
+            self.load_markets()
+
+    def preload(self, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Load markets and the wallet leverages concurrently, so the first trading calls
+        (fetch_balance, fetch_position, create_order) find both already cached.
+        """
+        markets, _ = _run_threaded(
+            lambda: self.load_markets(params=params or {}),
+            self._fetch_leverages_by_market_id,
+        )
+        return markets
+
     def _getSymbol(self, perp_name):
-        return perp_name.replace('RUSDPERP', '')
+        return perp_name.removesuffix(_REYA_SUFFIX)
 
     def convertSymbolToCcxtNotation(self, symbol):
-        if "/RUSD:RUSD" not in symbol:
-            symbol = self._getSymbol(symbol)
-            symbol = symbol + "/RUSD:RUSD"
-        return symbol
+        # BTCRUSDPERP -> BTC/RUSD:RUSD, only the suffixes are compared
+        if symbol is None or symbol.endswith(_CCXT_SUFFIX):
+            return symbol
+        return symbol.removesuffix(_REYA_SUFFIX) + _CCXT_SUFFIX
 
     def convertSymbolToReyaNotation(self, symbol):
-        if "RUSDPERP" not in symbol:
-            symbol = symbol.replace("/RUSD:RUSD", "RUSDPERP")
-        return symbol
+        # BTC/RUSD:RUSD -> BTCRUSDPERP
+        if symbol is None or not symbol.endswith(_CCXT_SUFFIX):
+            return symbol
+        return symbol[:-len(_CCXT_SUFFIX)] + _REYA_SUFFIX
 
     def _decimal_places(self, x):
         return int(-math.log10(float(x)))
@@ -395,18 +697,20 @@ class Reya(ccxt.Exchange, ImplicitAPI):
         res = self.publicGetApiMarkets(params or {})
         # the SDK/docs return a list of market objects
         result = res if isinstance(res, list) else self.safe_value(res, 'data', res)
-        self.markets = {self.safe_string(m, 'id', str(self.safe_integer(m,'marketId'))) : m for m in result }
-        self.markets_by_id = self.markets
+        underlyingAsset = "RUSD"
+        markets = {}
         out = []
-        for mid, m in self.markets.items():
-            quoteToken = self._getSymbol(m.get("symbol"))
-            underlyingAsset = "RUSD"
+        for m in result:
+            market_id = self.safe_string(m, 'marketId')
+            raw_id = m.get('id')
+            markets[market_id if raw_id is None else str(raw_id)] = m
+            quoteToken = m.get("symbol").removesuffix(_REYA_SUFFIX).upper()
             out.append({
-                'id': self.safe_string(m, 'marketId'),
-                'symbol': f"{quoteToken}/{underlyingAsset}:{underlyingAsset}".upper(),
-                'base': quoteToken.upper() if quoteToken is not None else '',
-                'quote': underlyingAsset.upper() if underlyingAsset is not None else '',
-                'asset_pair_id': self.safe_string_2(m, 'marketId', 'marketId'),
+                'id': market_id,
+                'symbol': quoteToken + _CCXT_SUFFIX,
+                'base': quoteToken,
+                'quote': underlyingAsset,
+                'asset_pair_id': market_id,
                 'type': 'swap',
                 'spot': False,
                 'margin': False,
@@ -418,16 +722,28 @@ class Reya(ccxt.Exchange, ImplicitAPI):
                 'limits': {'cost': {'min': 1}},
                 'info': m,
             })
+        self.markets = markets
+        self.markets_by_id = markets
         return out
 
     def fetch_funding_rate(self, symbol: str, params: object = {}) -> FundingRate | None:
-        self.load_markets(reload=True) #require reload because funding data is written there
-        for sym, market in self.markets.items():
-            if sym == symbol:
-                request = {"symbol": self.convertSymbolToReyaNotation(symbol)}
-                raw = self.public_get_api_market_summary(self.extend(request, params or {}))
-                fr = self._parse_funding_rate(symbol, market["info"], raw)
-                return fr
+        # funding data comes from the market summary, the market definitions only need to be loaded once
+        self._ensure_markets()
+        market = self._markets_by_symbol_or_id.get(symbol)
+        if market is None:
+            return None
+
+        now = time.monotonic()
+        ttl = self.safe_number(self.options, 'funding_rate_ttl', 0)
+        cached = self._funding_summary_cache.get(symbol)
+        if not params and cached is not None and now - cached["ts"] < ttl:
+            raw = cached["data"]
+        else:
+            request = {"symbol": self.convertSymbolToReyaNotation(symbol)}
+            raw = self.public_get_api_market_summary({**request, **(params or {})})
+            if not params:
+                self._funding_summary_cache[symbol] = {"data": raw, "ts": now}
+        return self._parse_funding_rate(symbol, market["info"], raw)
 
     def _parse_funding_rate(self, symbol, market, summary) -> FundingRate:
         # Summary
@@ -459,7 +775,7 @@ class Reya(ccxt.Exchange, ImplicitAPI):
         additionalInfo['fundingRateAnnualized'] = funding * 24 * 365
 
         return {
-            'info': self.extend(market, summary, additionalInfo),
+            'info': {**market, **summary, **additionalInfo},
             'symbol': symbol,
             'markPrice': markPx,
             'indexPrice': oraclePx,
@@ -480,24 +796,160 @@ class Reya(ccxt.Exchange, ImplicitAPI):
         }
 
 
+    def watch_prices(self) -> None:
+        """
+        Subscribe to the /v2/prices websocket channel in a background thread. While it runs, fetch_ticker and
+        fetch_tickers answer from the pushed prices (if younger than options['price_stream_max_age']) without REST.
+        """
+        if self._price_socket is not None:
+            return
+
+        def on_open(ws):
+            ws.prices.all_prices.subscribe()
+
+        def on_message(ws, message):
+            message_type = message.get("type")
+            if message_type == "channel_data" and message.get("channel") == "/v2/prices":
+                now = time.monotonic()
+                for raw in message.get("data") or []:
+                    self._streamed_prices[raw.get("symbol")] = {"data": raw, "ts": now}
+            elif message_type == "ping":
+                ws.send(json.dumps({"type": "pong"}))
+
+        def on_close(ws, close_status_code, close_reason):
+            self._price_socket = None
+            self._streamed_prices = {}
+
+        self._price_socket = ReyaSocket(on_open=on_open, on_message=on_message, on_close=on_close)
+        self._price_socket.connect()
+
+    def unwatch_prices(self) -> None:
+        if self._price_socket is not None:
+            self._price_socket.close()
+        self._price_socket = None
+        self._streamed_prices = {}
+
+    def watch_order_changes(self) -> None:
+        """
+        Subscribe to the wallet's /v2/wallet/{address}/orderChanges websocket channel in a background thread.
+        While it runs, fetch_order answers from the last pushed state of an order (if younger than
+        options['order_stream_max_age']) without REST, this includes orders that were filled or cancelled meanwhile.
+        """
+        if self._order_socket is not None:
+            return
+
+        def on_open(ws):
+            ws.wallet.order_changes(self.walletAddress).subscribe()
+
+        def on_message(ws, message):
+            message_type = message.get("type")
+            if message_type == "channel_data" and str(message.get("channel", "")).endswith("/orderChanges"):
+                now = time.monotonic()
+                for raw in message.get("data") or []:
+                    order_id = raw.get("orderId")
+                    if order_id is None or raw.get("status") is None:
+                        continue
+                    self._streamed_orders[str(order_id)] = {"data": raw, "ts": now}
+            elif message_type == "ping":
+                ws.send(json.dumps({"type": "pong"}))
+
+        def on_close(ws, close_status_code, close_reason):
+            self._order_socket = None
+            self._streamed_orders = {}
+
+        self._order_socket = ReyaSocket(on_open=on_open, on_message=on_message, on_close=on_close)
+        self._order_socket.connect()
+
+    def unwatch_order_changes(self) -> None:
+        if self._order_socket is not None:
+            self._order_socket.close()
+        self._order_socket = None
+        self._streamed_orders = {}
+
+    def _streamed_order(self, order_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._streamed_orders.get(order_id)
+        if entry is None or time.monotonic() - entry["ts"] > self.safe_number(self.options, 'order_stream_max_age', 0):
+            return None
+        return entry["data"]
+
+    def _streamed_price(self, reya_symbol: str) -> Optional[Dict[str, Any]]:
+        entry = self._streamed_prices.get(reya_symbol)
+        if entry is None or time.monotonic() - entry["ts"] > self.safe_number(self.options, 'price_stream_max_age', 0):
+            return None
+        return entry["data"]
+
     def fetch_ticker(self, symbol: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        self.load_markets()
+        self._ensure_markets()
         market = self.market(symbol)
         markTokenTicker = market['base'] + "RUSDPERP"
 
+        if not params:
+            # a fresh push or bulk snapshot already holds this symbol, e.g. when iterating over all symbols
+            raw = self._streamed_price(markTokenTicker)
+            cached = self._prices_cache
+            if raw is None and cached["data"] is not None and time.monotonic() - cached["ts"] < self.safe_number(self.options, 'prices_ttl', 0):
+                raw = cached["data"].get(markTokenTicker)
+            if raw is not None:
+                return self.parse_ticker(raw)
+
         request = {"symbol": markTokenTicker}
-        raw = self.public_get_api_trading_prices(self.extend(request, params or {}))
+        raw = self.public_get_api_trading_prices({**request, **(params or {})})
         parsed = self.parse_ticker(raw)
         return parsed
 
     def fetch_tickers(self, symbols: Optional[List[str]] = None, params: Optional[Dict] = None) -> Dict[str, Dict]:
-        raise NotImplementedError
+        # streamed prices first, otherwise one v2/prices round-trip for all markets; symbols missing from it
+        # fall back to per-symbol calls
+        self._ensure_markets()
+        symbols = list(symbols) if symbols else list(self.symbols)
+        reya_ids = [self.market(symbol)['base'] + _REYA_SUFFIX for symbol in symbols]
+        prices_by_id = {} if params else {reya_id: self._streamed_price(reya_id) for reya_id in reya_ids}
+        if any(raw is None for raw in prices_by_id.values()) or not prices_by_id:
+            prices_by_id = self._fetch_prices_by_id(params)
+        result = {}
+        missing = []
+        for symbol, reya_id in zip(symbols, reya_ids):
+            raw = prices_by_id.get(reya_id)
+            if raw is None:
+                missing.append(symbol)
+            else:
+                result[symbol] = self.parse_ticker(raw)
+        if missing:
+            batch_size = self.safe_integer(self.options, 'tickers_batch_size')
+            tickers = _run_threaded(
+                *(functools.partial(self.fetch_ticker, symbol, params) for symbol in missing),
+                limit=batch_size,
+            )
+            result.update(zip(missing, tickers))
+        return {symbol: result[symbol] for symbol in symbols}
+
+    def _fetch_prices_by_id(self, params: Optional[Dict] = None) -> Dict[str, Dict]:
+        now = time.monotonic()
+        ttl = self.safe_number(self.options, 'prices_ttl', 0)
+        if params or self._prices_cache["data"] is None or now - self._prices_cache["ts"] >= ttl:
+            prices_by_id = {raw.get("symbol"): raw for raw in self.public_get_api_trading_prices_all(params or {}) or []}
+            if params:
+                return prices_by_id
+            self._prices_cache = {"data": prices_by_id, "ts": now}
+        return self._prices_cache["data"]
+
+    async def fetch_tickers_async(self, symbols: Optional[List[str]] = None, params: Optional[Dict] = None) -> Dict[str, Dict]:
+        return await asyncio.to_thread(self.fetch_tickers, symbols, params)
 
     def fetch_order_book(self, symbol: str, limit: Optional[int] = 100, params: Optional[Dict] = None) -> Dict[str, Any]:
         raise NotImplementedError
 
+    def _ohlcv_delegate(self):
+        # one binance instance (and one markets load) shared by all Reya instances
+        with Reya._binance_delegate_lock:
+            if Reya._binance_delegate is None:
+                delegate = ccxt.binance()
+                delegate.load_markets()
+                Reya._binance_delegate = delegate
+        return Reya._binance_delegate
+
     def fetch_ohlcv(self, symbol: str, timeframe='1m', since: Int = None, limit: Int = None, params={}) -> List[list]:
-        exchange_delegate = ccxt.binance() # TODO espacialy for > 1D Timeframes?
+        exchange_delegate = self._ohlcv_delegate() # TODO espacialy for > 1D Timeframes?
         symbol = symbol.replace("RUSD", "USDT")
         return exchange_delegate.fetch_ohlcv(symbol, timeframe, since, limit, params)
 
@@ -520,7 +972,7 @@ class Reya(ccxt.Exchange, ImplicitAPI):
     #     request["symbol"] = markTokenTicker
     #     request["resolution"] = timeframe
     #
-    #     raw = self.public_get_historical_candles(self.extend(request, params or {}))
+    #     raw = self.public_get_historical_candles({**request, **(params or {})})
     #
     #
     #     # map timeframe to seconds
@@ -634,26 +1086,29 @@ class Reya(ccxt.Exchange, ImplicitAPI):
 
     def fetch_balance(self, params: Optional[Dict] = None) -> Dict[str, Any]:
         request = {"wallet_address": self.walletAddress}
-        balances = self.public_get_api_accounts_balance(self.extend(request, params or {}))
+        # balances, open orders and leverages are independent round-trips -> fetch them concurrently
+        balances, open_orders, levs = _run_threaded(
+            lambda: self.public_get_api_accounts_balance({**request, **(params or {})}),
+            self._open_orders_snapshot,
+            self.fetch_leverages,
+        )
         # Try SRUSD first TODO ETH Value? Multi Accounts?
         balance = 0
         for entry in balances:
-            if entry["asset"] == "SRUSD":
+            asset = entry["asset"]
+            if asset == "SRUSD":
                 balance += float(entry["realBalance"]) * 0.9 #staked only 90%, 10% haircut TODO
-        for entry in balances:
-            if entry["asset"] == "RUSD":
+            elif asset == "RUSD":
                 balance += float(entry["realBalance"])
 
         # raw expected to be list of balances
         # calc used since api didnt support it
-        openOrders = self.fetch_open_orders()
-        levs = self.fetch_leverages()
-        used = 0
-        for openOrder in openOrders:
-            amount = float(openOrder['amount'])
-            price = float(openOrder['price'])
-            value = (amount * price) / float(levs.get(openOrder['symbol'], 3))
-            used += value
+        # read straight from the raw open orders rows, parse_order is not needed for three fields
+        used = _used_margin(
+            ((row.get('qty') or 0, _first_present(row, 'limitPx', 'triggerPx'), self.convertSymbolToCcxtNotation(row.get('symbol')))
+             for row in open_orders["data"]),
+            levs,
+        )
 
         bal = {"RUSD": {}}
         # only knows RUSD for Trading
@@ -705,39 +1160,55 @@ class Reya(ccxt.Exchange, ImplicitAPI):
     def set_margin_mode(self, marginMode: str, symbol: Str = None, params={}):
        return True #mock TODO
 
-    lev_map = {}
+    def set_leverage(self, leverage: Int, symbol: Str = None, params={}):
+        # leverage is changed in the Reya app, drop the cached snapshot so the next read sees the new value
+        self._lev_cache = {"data": None, "ts": 0.0}
+        return True #mock TODO
 
-    def fetch_leverage(self, symbol: str, params={}):
+    def _fetch_leverages_by_market_id(self, params=None) -> Dict[str, int]:
         # [
         #     {"accountId":"","marketId":"2","leverage":3,"createdAt":"2025-08-15T21:38:17.822Z","updatedAt":"2025-08-15T21:38:17.822Z"}
         # ]
+        now = time.monotonic()
+        ttl = self.safe_number(self.options, 'leverages_ttl', 0)
+        if not params and self._lev_cache["data"] is not None and now - self._lev_cache["ts"] < ttl:
+            return self._lev_cache["data"]
+
         request = {"wallet_address": self.walletAddress}
-        levs = self.public_get_leverages(self.extend(request, params or {}))
-        if self.lev_map == {}:
-            self.lev_map = {lev['marketId']: int(lev['leverage']) for lev in levs}
+        levs = self.public_get_leverages({**request, **(params or {})})
+        # keyed by the string market id, whether the API sends marketId as string or int
+        lev_map_by_id = {str(lev["marketId"]): int(lev["leverage"]) for lev in levs}
+        self._lev_cache = {"data": lev_map_by_id, "ts": now}
+        return lev_map_by_id
+
+    def fetch_leverage(self, symbol: str, params={}):
+        lev_map_by_id = self._fetch_leverages_by_market_id(params)
 
         market_id = None
         if symbol is not None:
-            market = self.markets.get(symbol)
+            self._ensure_markets()
+            market = self._markets_by_symbol_or_id.get(symbol)
             if market is None:
                 raise ccxt.ExchangeError(f"{self.id} fetch_leverage symbol {symbol} not found in markets")
-            market_id = market.get('id') or market.get('market_id')
+            market_id = self._market_ids_by_symbol[market['symbol']][0]
+
+        return lev_map_by_id.get(market_id, 3)  # Default = 3
 
-        return self.lev_map.get(market_id, 3)  # Default = 3
+    async def fetch_leverage_async(self, symbol: str, params={}):
+        # for callers running inside an event loop: the blocking request runs in a worker thread, the
+        # cached leverages are shared with the sync methods
+        return await asyncio.to_thread(self.fetch_leverage, symbol, params)
 
     def fetch_leverages(self, symbols: Strings = None, params={}):
-        # [
-        #     {"accountId":"","marketId":"2","leverage":3,"createdAt":"2025-08-15T21:38:17.822Z","updatedAt":"2025-08-15T21:38:17.822Z"}
-        # ]
-        request = {"wallet_address": self.walletAddress}
-        levs = self.public_get_leverages(self.extend(request, params or {}))
-        lev_map_by_id = {lev["marketId"]: int(lev["leverage"]) for lev in levs}
+        lev_map_by_id = self._fetch_leverages_by_market_id(params)
 
+        # walk the (few) leverage entries and resolve each market id through the index, not all markets
+        self._ensure_markets()
         symbol_lev_map = {}
-        for symbol, market in self.markets.items():
-            market_id = market.get("id") or market.get("market_id")
-            if market_id in lev_map_by_id:
-                symbol_lev_map[symbol] = lev_map_by_id[market_id]
+        for market_id, leverage in lev_map_by_id.items():
+            market = self._markets_by_symbol_or_id.get(str(market_id))
+            if market is not None:
+                symbol_lev_map[market['symbol']] = leverage
 
         self.lev_map = symbol_lev_map
 
@@ -770,112 +1241,146 @@ class Reya(ccxt.Exchange, ImplicitAPI):
         # ]
 
         request = {"wallet_address": self.walletAddress}
-        positions = self.public_get_positions(self.extend(request, params or {}))
-        if positions is []:
-            return []
-
-        result = []
+        positions = self.public_get_positions({**request, **(params or {})})
+        if not positions:
+            return [] if symbol is None else None
+
+        self._ensure_markets()
+        reya_symbol = self.convertSymbolToReyaNotation(symbol)
+        # the numeric columns of the kept rows are read in the same pass that filters them
+        rows = []
+        qtys = []
+        avg_entries = []
+        funding_values = []
+        last_prices = []
         for raw in positions:
-            if symbol is not None:
-                symbol = self.convertSymbolToReyaNotation(symbol)
-            if symbol is not None and raw.get("symbol") == symbol:
-                base_amount = self.safe_number(raw, 'qty')
-                mark_price = self.fetch_ticker(self.convertSymbolToCcxtNotation(symbol))['last']
+            get = raw.get
+            if reya_symbol is not None and get("symbol") != reya_symbol:
+                continue
+            qty = _float_or_none(get('qty'))
+            if qty != 0:  #0er position manuell filter
+                rows.append(raw)
+                qtys.append(qty)
+                avg_entries.append(_float_or_none(get('avgEntryPrice')))
+                funding_values.append(_float_or_none(get('avgEntryFundingValue')))
                 # #use avg price?
-                last_price = self.safe_number(raw, 'last_price')
-                # realized_pnl = safe_div(self.safe_number(raw, 'realized_pnl'), base_multiplier)
-                funding_value = self.safe_number(raw, 'avgEntryFundingValue')
-                # #avg_entry = safe_div(self.safe_number(raw, 'average_entry_funding_value'), base_multiplier)
-                #
-                # # session = int(self.safe_number(raw, 'session'))
-                # # filledOrders = self.fetch_closed_orders(symbol=symbol)
-                # # #für akt position relevant
-                # # total_cost = 0.0
-                # # total_qty = 0.0
-                # # count = 0
-                # # for filled in filledOrders:
-                # #     if int(filled["info"]["position_session"]) == session and filled['side'] == EOrderSide.BUY.value:
-                # #         filledPrice = float(filled["price"])
-                # #         filledAmount = float(filled["amount"])
-                # #         total_cost += filledPrice * filledAmount
-                # #         total_qty += filledAmount
-                # #         count += 1
-                # # avg_entry = total_cost / total_qty if total_qty > 0 else None
-                avg_entry = self.safe_number(raw, 'avgEntryPrice')
-
-                pnl = base_amount * (mark_price - avg_entry)
-
-                if funding_value < 0:
-                    pnl = pnl + funding_value
-                if base_amount == 0: #0er position manuell filter
-                    continue
-
-                leverage = self.fetch_leverage(self.convertSymbolToCcxtNotation(symbol))
-                liquidationPrice = avg_entry * (1 - 1/leverage)
-
-                orders = self.fetch_open_orders(self.convertSymbolToCcxtNotation(symbol))
-                tp = 0
-                sl = 0
-                for order in orders:
-                    if ("params" in order and "takeProfitPrice" in order['params']) or order['info']['order_type'] == "Take Profit":
-                        tp = order['price']
-                    if ("params" in order and "stopLossPrice" in order['params']) or order['info']['order_type'] == "Stop Loss":
-                        sl = order['price']
-
-                position = {
-                    "size": base_amount,
-                    "entryPrice": avg_entry,  # API doesn't give entry price, fallback to last_price
-                    "lastPrice": mark_price,
-                    "positionValue": base_amount * last_price if base_amount is not None and last_price is not None else None,
-                    "unrealisedPnl": pnl,  # no unrealized from API, using realized for now
-                    "takeProfit": tp,
-                    "stopLoss": sl,
-                    "liquidationPrice": liquidationPrice,
-                    "fundingValue": funding_value,
-                }
-
-                raw["size"] = base_amount
-                raw["curRealisedPnl"] = 0
-                raw["unrealisedPnl"] = pnl
-
-                safePosition = self.safe_position({
-                    'info': raw,
-                    'position': position,
-                    'id': raw.get('unique_id'),
-                    'symbol': symbol,
-                    'timestamp': None,
-                    'datetime': None,
-                    'isolated': True,
-                    'hedged': None,
-                    'side': EOrderSide.BUY.value if raw.get('side') == 'B' else EOrderSide.SELL.value,
-                    'contracts': position["size"],
-                    'amount': position["size"],
-                    'contractSize': None,
-                    'entryPrice': position["entryPrice"],
-                    'markPrice': mark_price,
-                    'notional': position["positionValue"],
-                    'leverage': leverage,
-                    'collateral': 0,
-                    'initialMargin': self.parse_number(1),
-                    'maintenanceMargin': None,
-                    'initialMarginPercentage': None,
-                    'maintenanceMarginPercentage': None,
-                    'unrealizedPnl': position["unrealisedPnl"],
-                    'takeProfitPrice': position["takeProfit"],
-                    'stopLossPrice': position["stopLoss"],
-                    'liquidationPrice': position["liquidationPrice"],
-                    'marginMode': False,
-                    'percentage': self.parse_number(50),
-                })
-
-                result.append(safePosition)
+                last_prices.append(_float_or_none(get('last_price')))
+                if reya_symbol is not None:
+                    # a single symbol query returns the first open position, the remaining rows are not needed
+                    break
+        if not rows:
+            return [] if symbol is None else None
+
+        # tickers, leverages and open orders are fetched once for all rows and concurrently, not per position
+        ccxt_symbols = list(dict.fromkeys(self.convertSymbolToCcxtNotation(raw["symbol"]) for raw in rows))
+        tickers, leverages, open_orders = _run_threaded(
+            lambda: self.fetch_tickers(ccxt_symbols),
+            self.fetch_leverages,
+            lambda: self.fetch_open_orders(self.convertSymbolToCcxtNotation(symbol)),
+        )
+        # one pass over the open orders buckets the first take profit / stop loss price per symbol
+        tp_by_symbol: Dict[str, Any] = {}
+        sl_by_symbol: Dict[str, Any] = {}
+        bucket_by_order_type = {"Take Profit": tp_by_symbol, "Stop Loss": sl_by_symbol}
+        for order in open_orders:
+            order_params = order.get('params') or {}
+            if "takeProfitPrice" in order_params:
+                bucket = tp_by_symbol
+            else:
+                bucket = bucket_by_order_type.get((order.get('info') or {}).get('order_type'))
+                if bucket is None and "stopLossPrice" in order_params:
+                    bucket = sl_by_symbol
+            if bucket is not None:
+                bucket.setdefault(order['symbol'], order['price'])
+
+        # the pnl / liquidation math runs over all rows in one go
+        row_ccxt_symbols = [self.convertSymbolToCcxtNotation(raw["symbol"]) for raw in rows]
+        marks = [tickers[ccxt_symbol]['last'] for ccxt_symbol in row_ccxt_symbols]
+        row_leverages = [leverages.get(ccxt_symbol, 3) for ccxt_symbol in row_ccxt_symbols]  # Default = 3
+        pnls, liquidation_prices, notionals = _position_metrics(
+            qtys, marks, avg_entries, funding_values, row_leverages, last_prices)
+
+        # row-invariant values of the position dicts
+        initial_margin = self.parse_number(1)
+        percentage = self.parse_number(50)
+
+        result = []
+        for raw, ccxt_symbol, base_amount, mark_price, leverage, avg_entry, funding_value, pnl, liquidationPrice, notional in zip(
+                rows, row_ccxt_symbols, qtys, marks, row_leverages, avg_entries, funding_values, pnls, liquidation_prices,
+                notionals):
+            row_symbol = raw["symbol"]
+            # realized_pnl = safe_div(self.safe_number(raw, 'realized_pnl'), base_multiplier)
+            # #avg_entry = safe_div(self.safe_number(raw, 'average_entry_funding_value'), base_multiplier)
+            #
+            # # session = int(self.safe_number(raw, 'session'))
+            # # filledOrders = self.fetch_closed_orders(symbol=symbol)
+            # # #für akt position relevant
+            # # total_cost = 0.0
+            # # total_qty = 0.0
+            # # count = 0
+            # # for filled in filledOrders:
+            # #     if int(filled["info"]["position_session"]) == session and filled['side'] == EOrderSide.BUY.value:
+            # #         filledPrice = float(filled["price"])
+            # #         filledAmount = float(filled["amount"])
+            # #         total_cost += filledPrice * filledAmount
+            # #         total_qty += filledAmount
+            # #         count += 1
+            # # avg_entry = total_cost / total_qty if total_qty > 0 else None
+
+            tp = tp_by_symbol.get(ccxt_symbol) or 0
+            sl = sl_by_symbol.get(ccxt_symbol) or 0
+
+            position = {
+                "size": base_amount,
+                "entryPrice": avg_entry,  # API doesn't give entry price, fallback to last_price
+                "lastPrice": mark_price,
+                "positionValue": notional,
+                "unrealisedPnl": pnl,  # no unrealized from API, using realized for now
+                "takeProfit": tp,
+                "stopLoss": sl,
+                "liquidationPrice": liquidationPrice,
+                "fundingValue": funding_value,
+            }
+
+            raw["size"] = base_amount
+            raw["curRealisedPnl"] = 0
+            raw["unrealisedPnl"] = pnl
+
+            safePosition = self.safe_position({
+                'info': raw,
+                'position': position,
+                'id': raw.get('unique_id'),
+                'symbol': row_symbol,
+                'timestamp': None,
+                'datetime': None,
+                'isolated': True,
+                'hedged': None,
+                'side': _SIDE_BY_RAW.get(raw.get('side'), _SELL),
+                'contracts': base_amount,
+                'amount': base_amount,
+                'contractSize': None,
+                'entryPrice': avg_entry,
+                'markPrice': mark_price,
+                'notional': position["positionValue"],
+                'leverage': leverage,
+                'collateral': 0,
+                'initialMargin': initial_margin,
+                'maintenanceMargin': None,
+                'initialMarginPercentage': None,
+                'maintenanceMarginPercentage': None,
+                'unrealizedPnl': pnl,
+                'takeProfitPrice': tp,
+                'stopLossPrice': sl,
+                'liquidationPrice': liquidationPrice,
+                'marginMode': False,
+                'percentage': percentage,
+            })
+
+            result.append(safePosition)
 
         if symbol is None:
             return result
-        else:
-            for res in result:
-                if res['symbol'] == symbol:
-                    return res
+        return result[0]
 
     # -------------------
     # Private / wallet & orders
@@ -891,73 +1396,45 @@ class Reya(ccxt.Exchange, ImplicitAPI):
         This method will attempt to fill accountId from options if not provided in params.
         """
         params = params or {}
-        markets = self.load_markets()
-        # map symbol to market_id/exchange_id/assetPairId if available
-        market_id = params.get('marketId')
-        exchange_id = REYA_DEX_ID
-        for m in markets.values():
-            if m.get('symbol') == symbol or str(m.get('id')) == str(symbol):
-                market_id = market_id or m.get('id')
-                exchange_id = exchange_id or m.get('exchange_id') or m.get('exchangeId') or exchange_id
-                break
+        self._ensure_markets()
         account_id = params.get('accountId') or self.safe_value(self.options, 'account_id')
         if account_id is None:
             raise RuntimeError("create_order requires accountId either in params or options['account_id']")
         reduceOnly = False
         symbol = self.convertSymbolToReyaNotation(symbol)
 
-        if type == EOrderType.LIMIT.value:
-            time_in_force = TimeInForce.GTC
-            limit_params = LimitOrderParameters(
-                market_id=int(market_id) if market_id is not None else None,
-                symbol=symbol,
-                is_buy=True if side.lower() == 'buy' else False,
-                limit_px=str(price) if price is not None else None,
-                qty=str(amount),
-                time_in_force=time_in_force,
-                expires_after=params.get('expires_after')
-            )
-        else:
-            time_in_force = TimeInForce.IOC
-            limit_params = LimitOrderParameters(
-                market_id=int(market_id) if market_id is not None else None,
-                symbol=symbol,
-                is_buy=True if side.lower() == 'buy' else False,
-                limit_px=str(price) if price is not None else None,
-                qty=str(amount),
-                time_in_force=time_in_force,
-                reduce_only=reduceOnly,
-                expires_after=params.get('expires_after'))
-
-        result = None
-        if params is not None and params != {}:
+        # limit orders rest (GTC), anything else is sent as an IOC limit order
+        is_limit = type == EOrderType.LIMIT.value
+        is_buy = _SIDE_IS_BUY.get(side)
+        if is_buy is None:
+            is_buy = side.lower() == EOrderSide.BUY.value
+        limit_params = LimitOrderParameters(
+            symbol=symbol,
+            is_buy=is_buy,
+            limit_px=str(price) if price is not None else None,
+            qty=str(amount),
+            time_in_force=TimeInForce.GTC if is_limit else TimeInForce.IOC,
+            reduce_only=None if is_limit else reduceOnly,
+            expires_after=params.get('expires_after'),
+        )
+
+        if "takeProfitPrice" in params or "stopLossPrice" in params:
             if "takeProfitPrice" in params:
-                takeProfitPrice = params['takeProfitPrice']
-                result:CreateOrderResponse = run_async(self.client.create_trigger_order(
-                    TriggerOrderParameters(
-                        market_id=int(market_id),
-                        symbol=symbol,
-                        is_buy=False,
-                        trigger_px=str(takeProfitPrice),
-                        trigger_type=OrderType.TP,
-                    )
-                ))
-            elif "stopLossPrice" in params:
-                stopLossPrice = params['stopLossPrice']
-                result:CreateOrderResponse = run_async(self.client.create_trigger_order(
-                    TriggerOrderParameters(
-                        market_id=int(market_id),
-                        symbol=symbol,
-                        is_buy=False,
-                        trigger_px=str(stopLossPrice),
-                        trigger_type=OrderType.SL,
-                    )
-                ))
-            elif "reduceOnly" or "reduce_only" in params:
-                result: CreateOrderResponse = run_async(self.client.create_limit_order(limit_params))
+                trigger_type, trigger_px = OrderType.TP, params['takeProfitPrice']
+            else:
+                trigger_type, trigger_px = OrderType.SL, params['stopLossPrice']
+            result: CreateOrderResponse = run_async(self.client.create_trigger_order(
+                TriggerOrderParameters(  # the SDK resolves the market from the symbol
+                    symbol=symbol,
+                    is_buy=False,
+                    trigger_px=str(trigger_px),
+                    trigger_type=trigger_type,
+                )
+            ))
         else:
-            result:CreateOrderResponse = run_async(self.client.create_limit_order(limit_params))
+            result: CreateOrderResponse = run_async(self.client.create_limit_order(limit_params))
 
+        self._open_orders_cache = {"data": None, "ts": 0.0}
         id = None
         status = "open"
         if result is not None:
@@ -968,13 +1445,14 @@ class Reya(ccxt.Exchange, ImplicitAPI):
             return None
 
 
+        created = self.iso8601(_now_ms())
         return self.safe_order({ #TODO values
             'info': result,
             'id': id,
             'order':id,
             'clientOrderId': id,
-            'timestamp': self.iso8601(int(time.time() * 1000)),
-            'datetime':self.iso8601(int(time.time() * 1000)),
+            'timestamp': created,
+            'datetime': created,
             'symbol': symbol,
             'type': type,
             'timeInForce': False,
@@ -999,6 +1477,36 @@ class Reya(ccxt.Exchange, ImplicitAPI):
                 },
             'trades': []})
 
+    async def create_order_async(self, symbol: str, type: str, side: str, amount: float, price: Optional[float] = None,
+                                 params: Optional[Dict] = None) -> Dict[str, Any]:
+        # lets tasks of the caller's event loop submit orders concurrently without blocking that loop; the SDK
+        # call itself still runs on the background loop that owns the client's connection pool
+        return await asyncio.to_thread(self.create_order, symbol, type, side, amount, price, params)
+
+    def create_orders(self, orders: List[Dict[str, Any]], params={}) -> List[Dict[str, Any]]:
+        """
+        Submit several orders ({symbol, type, side, amount, price, params}) in one call.
+        Reya has no batch endpoint, so orders of different markets are submitted concurrently while
+        orders of one market go one after another: the SDK derives the order nonce from
+        (account, market, millisecond timestamp) and concurrent submits could collide on it.
+        """
+        orders_by_symbol: Dict[str, List] = {}
+        for index, order in enumerate(orders):
+            orders_by_symbol.setdefault(order['symbol'], []).append((index, order))
+
+        def submit(indexed_orders):
+            return [
+                (index, self.create_order(order['symbol'], order['type'], order['side'], order['amount'],
+                                          order.get('price'), {**params, **(order.get('params') or {})}))
+                for index, order in indexed_orders
+            ]
+
+        results: List[Any] = [None] * len(orders)
+        for submitted in _run_threaded(*(functools.partial(submit, group) for group in orders_by_symbol.values())):
+            for index, created in submitted:
+                results[index] = created
+        return results
+
     def create_limit_order(self, symbol: str, side: OrderSide, amount: float, price: float, params={}):
         return self.create_order(symbol, EOrderType.LIMIT.value, side, amount, price, params)
 
@@ -1007,11 +1515,43 @@ class Reya(ccxt.Exchange, ImplicitAPI):
 
     def cancel_order(self, id: str, symbol: Str = None, params={}):
         result:CancelOrderResponse = run_async(self.client.cancel_order(order_id=id))
+        self._open_orders_cache = {"data": None, "ts": 0.0}
         return result.status == "CANCELLED"
 
+    def cancel_orders(self, ids: List[str], symbol: Str = None, params={}) -> List[bool]:
+        """
+        Cancel several orders at once. Reya has no batch cancel endpoint, the single cancels run
+        concurrently on the background loop (at most options['cancel_concurrency'] in flight).
+        Returns one flag per id; a cancel that failed with an error is reported as False.
+        """
+        limit = self.safe_integer(self.options, 'cancel_concurrency', 8)
+
+        async def cancel_all():
+            semaphore = asyncio.Semaphore(limit)
+
+            async def cancel(order_id):
+                async with semaphore:
+                    return await self.client.cancel_order(order_id=order_id)
+
+            return await asyncio.gather(*(cancel(order_id) for order_id in ids), return_exceptions=True)
+
+        try:
+            results = run_async(cancel_all())
+        finally:
+            # some cancels may have gone through even if the call failed, the snapshot is stale either way
+            self._open_orders_cache = {"data": None, "ts": 0.0}
+        return [not isinstance(result, BaseException) and result.status == "CANCELLED" for result in results]
+
     def fetch_accounts(self, params={}):
+        # the accounts of a wallet rarely change, polling loops are served from a short-lived snapshot
+        now = time.monotonic()
+        ttl = self.safe_number(self.options, 'accounts_ttl', 0)
+        if not params and self._accounts_cache["data"] is not None and now - self._accounts_cache["ts"] < ttl:
+            return self._accounts_cache["data"]
         request = {"wallet_address": self.walletAddress}
-        accounts = self.public_get_wallet_accounts(self.extend(request, params or {}))
+        accounts = self.public_get_wallet_accounts({**request, **(params or {})})
+        if not params:
+            self._accounts_cache = {"data": accounts, "ts": now}
         return accounts
 
     def fetch_order(self, id: str, symbol: str = None, params: Optional[Dict] = None):
@@ -1034,52 +1574,75 @@ class Reya(ccxt.Exchange, ImplicitAPI):
         #         "lastUpdateAt": 1747927089946
         #     }
         # ]
-        request = {"wallet_address": self.walletAddress}
-        items = self.public_get_open_orders(self.extend(request, params or {}))
+        item = self._streamed_order(str(id)) if not params else None
+        if item is None:
+            item = self._raw_open_orders_by_id(params).get(str(id))
         symbol = self.convertSymbolToReyaNotation(symbol)
-        for item in items:
-            order_id = str(item.get('order_id') or item.get('orderId') or item.get('id'))
-            if order_id != str(id):
-                continue
-            if symbol is None:
-                return self.parse_order(item)
-            if symbol == item['symbol']:
-                return self.parse_order(item)
+        if item is not None and (symbol is None or symbol == item['symbol']):
+            return self.parse_order(dict(item))
         raise ccxt.OrderNotFound(self.id + " fetch_order could not find order id " + str(id))
 
     def fetch_orders(self, symbol: Optional[str] = None, since: Optional[int] = None, limit: Optional[int] = None,
                      params: Optional[Dict] = None) -> List[Dict]:
-        request = {"wallet_address": self.walletAddress}
-        items = self.public_get_open_orders(self.extend(request, params or {}))
+        items = self._fetch_raw_open_orders(params)
+        # served from the open orders snapshot taken just above
         items2 = self.fetch_my_trades(symbol=symbol, since=since, limit=limit, params=params)
         items2 = [trade['info'] for trade in items2]
 
-        # Filter by symbol if provided
-        if symbol is not None:
-            market = self.markets.get(symbol)
-            if market is None:
-                raise ccxt.ExchangeError(f"{self.id} fetch_orders symbol {symbol} not found in markets")
-            market_id = market.get('id') or market.get('market_id') or None
-            filteredOrders = []
-            for item in items:
-                order_market_id = item.get('market_id') or item.get('marketId') or None
-                if order_market_id is not None and str(order_market_id) == str(market_id):
-                    item['symbol'] = symbol
-                    filteredOrders.append(item)
-            filteredTrades = []
-            for item in items2:
-                order_market_id = item.get('market_id') or item.get('marketId') or None
-                if order_market_id is not None and str(order_market_id) == str(market_id):
-                    item['symbol'] = symbol
-                    filteredTrades.append(item)
-            items2 = filteredTrades
+        if symbol is None:
+            return self.parse_orders_bulk(items) + self.parse_trades_bulk(items2)
+
+        # single pass over the open orders: filter by market and parse in one go. The trades are already
+        # filtered (and tagged with the symbol) by fetch_my_trades.
+        market = self._markets_by_symbol_or_id.get(symbol)
+        if market is None:
+            raise ccxt.ExchangeError(f"{self.id} fetch_orders symbol {symbol} not found in markets")
+        market_id, market_id_num = self._market_ids_by_symbol[market['symbol']]
+        matched = []
+        for item in items:
+            if _matches_market_id(item, market_id, market_id_num):
+                item['symbol'] = symbol
+                matched.append(item)
+        return self.parse_orders_bulk(matched) + self.parse_trades_bulk(items2)
+
+    def _open_orders_snapshot(self, params=None) -> Dict[str, Any]:
+        # fetch_orders, fetch_my_trades and fetch_position hit this endpoint within one user action,
+        # a short-lived snapshot lets such a burst share one response
+        now = time.monotonic()
+        ttl = self.safe_number(self.options, 'open_orders_ttl', 0)
+        if params or self._open_orders_cache["data"] is None or now - self._open_orders_cache["ts"] >= ttl:
+            request = {"wallet_address": self.walletAddress}
+            items = self.public_get_open_orders({**request, **(params or {})})
+            if params:
+                return {"data": items, "ts": now}
+            self._open_orders_cache = {"data": items, "ts": now}
+        return self._open_orders_cache
+
+    def _fetch_raw_open_orders(self, params=None) -> List[Dict]:
+        # callers annotate the rows (symbol, order_type), hand out copies so the snapshot stays raw
+        return [dict(item) for item in self._open_orders_snapshot(params)["data"]]
+
+    def _raw_open_orders_by_id(self, params=None) -> Dict[str, Dict]:
+        # id index built once per snapshot, so polling fetch_order on a just placed order is a dict lookup
+        snapshot = self._open_orders_snapshot(params)
+        if "by_id" not in snapshot:
+            snapshot["by_id"] = {
+                str(item.get('order_id') or item.get('orderId') or item.get('id')): item
+                for item in reversed(snapshot["data"])  # first occurrence wins, like the former scan
+            }
+        return snapshot["by_id"]
 
-        return [self.parse_order(o) for o in items] +  [self.parse_trade(o) for o in items2]
+    def fetch_open_orders_count(self, symbol: Optional[str] = None, params: Optional[Dict] = None) -> int:
+        # counts the raw rows of the open orders snapshot, nothing is copied or parsed
+        rows = self._open_orders_snapshot(params)["data"]
+        if symbol is None:
+            return len(rows)
+        reya_symbol = self.convertSymbolToReyaNotation(symbol)
+        return sum(1 for row in rows if row.get('symbol') == reya_symbol)
 
     def fetch_open_orders(self, symbol: Optional[str] = None, since: Optional[int] = None, limit: Optional[int] = None,
                           params: Optional[Dict] = None) -> List[Dict]:
-        request = {"wallet_address": self.walletAddress}
-        items = self.public_get_open_orders(self.extend(request, params or {}))
+        items = self._fetch_raw_open_orders(params)
 
         if symbol is not None:
             symbol = self.convertSymbolToReyaNotation(symbol)
@@ -1088,46 +1651,41 @@ class Reya(ccxt.Exchange, ImplicitAPI):
                 if item.get('symbol') == symbol:
                     item['symbol'] = symbol
                     filteredOrders.append(item)
-            return [self.parse_order(o) for o in filteredOrders]
-        return [self.parse_order(o) for o in items]
+            return self.parse_orders_bulk(filteredOrders)
+        return self.parse_orders_bulk(items)
 
     def fetch_my_trades(self, symbol: Optional[str] = None, since: Optional[int] = None, limit: Optional[int] = None,
                         params: Optional[Dict] = None) -> List[Dict]:
         #TODO start end time filtering
         params = params or {}
 
-        request = {"wallet_address": self.walletAddress}
-        items = self.public_get_open_orders(self.extend(request, params or {}))
+        items = self._fetch_raw_open_orders(params)
 
         # Filter by symbol if provided
         if symbol is not None:
-            market = self.markets.get(symbol)
+            self._ensure_markets()
+            market = self._markets_by_symbol_or_id.get(symbol)
             if market is None:
                 raise ccxt.ExchangeError(f"{self.id} fetch_my_trades symbol {symbol} not found in markets")
-            market_id = market.get('id') or market.get('market_id') or None
+            target, target_num = self._market_ids_by_symbol[market['symbol']]
             filtered = []
             for t in items:
-                trade_market_id = t.get('market_id') or t.get('marketId') or None
-                if trade_market_id is not None and str(trade_market_id) == str(market_id):
+                if _matches_market_id(t, target, target_num):
                     t['symbol'] = symbol
                     filtered.append(t)
             items = filtered
 
-        return [self.parse_trade(t) for t in items]
+        return self.parse_trades_bulk(items)
 
     def fetch_trades(self, symbol: str, since: Optional[int] = None, limit: Optional[int] = None,
                      params: Optional[Dict] = None) -> List[Dict]:
-        markets = self.load_markets()
-        market_id = None
-        for m in markets.values():
-            if m.get('symbol') == symbol or str(m.get('id')) == str(symbol):
-                market_id = m.get('id')
-                break
+        self._ensure_markets()
+        m = self._markets_by_symbol_or_id.get(str(symbol))
+        market_id = m.get('id') if m is not None else None
         if market_id is None:
             raise ccxt.ExchangeError(f"{self.id} fetch_trades could not find market id for symbol {symbol}")
 
-        request = {"wallet_address": self.walletAddress}
-        items = self.public_get_open_orders(self.extend(request, params or {}))
+        items = self._fetch_raw_open_orders(params)
 
         # Apply since and limit client-side if needed:
         if since is not None:
@@ -1137,15 +1695,14 @@ class Reya(ccxt.Exchange, ImplicitAPI):
 
         for i in items:
             i['symbol'] = symbol
-        return [self.parse_trade(t) for t in items]
+        return self.parse_trades_bulk(items)
 
     # deposit / withdraw (wallet endpoints)
     def fetch_deposit_address(self, code: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         wallet_address = self.safe_value(self.options, 'wallet_address')
         if wallet_address is None:
             raise RuntimeError("fetch_deposit_address requires options['wallet_address']")
-        path = f"api/trading/wallet/{wallet_address}/deposit-address"
-        res = self.request(path, 'private', 'GET', params or {}, None)
+        res = self.request(_DEPOSIT_ADDRESS_PATH % wallet_address, 'private', 'GET', params or {}, None)
         return res
 
     def withdraw(self, code: str, amount: float, address: str, params: Optional[Dict] = None) -> Dict[str, Any]:
@@ -1154,12 +1711,19 @@ class Reya(ccxt.Exchange, ImplicitAPI):
             raise RuntimeError("withdraw requires options['wallet_address']")
         body = {"currency": code, "amount": str(amount), "address": address}
         body.update(params or {})
-        signed = self.sign("api/trading/wallet/withdraw", "private", "POST", body, None, None)
-        return self.request("api/trading/wallet/withdraw", 'private', 'POST', body, signed['headers'])
+        # request() signs the payload itself, signing it up front as well only produced a second signature
+        return self.request(_WITHDRAW_PATH, 'private', 'POST', body)
 
     def get_current_stake_apy(self):
         request = {"pool_id": 1}
         return self.public_apy(request)
 
     def close(self):
+        self.unwatch_prices()
+        self.unwatch_order_changes()
+        loop = _LOOP
+        if loop is None or not loop.is_running() or sys.is_finalizing():
+            # no SDK call ever ran (nothing to close), or the interpreter is exiting and the loop thread is
+            # stopped or frozen: starting or waiting on it from __del__ would hang shutdown
+            return None
         return run_async(self.client.close())
\ No newline at end of file
@@ -2,23 +2,22 @@ from enum import Enum
 
 
 class EOrderSide(str, Enum):
-    BUY = "buy",
+    BUY = "buy"
     SELL = "sell"
 
     @classmethod
     def valueOf(cls, value):
-        for k, v in cls.__members__.items():
-            if v == value:
-                return v
-        else:
+        member = cls._value2member_map_.get(value)
+        if member is None:
             raise ValueError(f"'{cls.__name__}' enum not found for '{value}'")
+        return member
 
     def __str__(self):
         return self.value
 
 
 class EOrderStatus(str, Enum):
-    CLOSED = "closed",
+    CLOSED = "closed"
     PARTIALLY_FILLED = "partially-filled"
     FILLED = "filled"
     REJECTED = "rejected"
@@ -28,11 +27,10 @@ class EOrderStatus(str, Enum):
 
     @classmethod
     def valueOf(cls, value):
-        for k, v in cls.__members__.items():
-            if v == value:
-                return v
-        else:
+        member = cls._value2member_map_.get(value)
+        if member is None:
             raise ValueError(f"'{cls.__name__}' enum not found for '{value}'")
+        return member
 
     def __str__(self):
         return self.value
@@ -43,11 +41,10 @@ class EOrderType(str, Enum):
 
     @classmethod
     def valueOf(cls, value):
-        for k, v in cls.__members__.items():
-            if v == value:
-                return v
-        else:
+        member = cls._value2member_map_.get(value)
+        if member is None:
             raise ValueError(f"'{cls.__name__}' enum not found for '{value}'")
+        return member
 
     def __str__(self):
         return self.value
@@ -1,4 +1,9 @@
+import json
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from dotenv import load_dotenv
 
@@ -10,6 +15,30 @@ from sdk.reya_rest_api import TradingConfig, ReyaTradingClient
 # Set up logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
+BUY, SELL = EOrderSide.BUY.value, EOrderSide.SELL.value
+LIMIT, MARKET = EOrderType.LIMIT.value, EOrderType.MARKET.value
+
+# opt-in: REYA_MARKETS_CACHE=/path/to/markets.json keeps the loaded markets between runs
+MARKETS_CACHE = Path(os.environ["REYA_MARKETS_CACHE"]).expanduser() if os.getenv("REYA_MARKETS_CACHE") else None
+MARKETS_CACHE_TTL = 300  # seconds
+
+
+def restore_markets(exchange):
+    # repeated script runs reuse the market definitions of a recent run instead of downloading them again
+    if MARKETS_CACHE is None:
+        return False
+    if MARKETS_CACHE.exists() and time.time() - MARKETS_CACHE.stat().st_mtime < MARKETS_CACHE_TTL:
+        exchange.set_markets(json.loads(MARKETS_CACHE.read_bytes()))
+        return True
+    return False
+
+
+def store_markets(exchange):
+    if MARKETS_CACHE is None:
+        return
+    MARKETS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    MARKETS_CACHE.write_text(json.dumps(exchange.markets))
+
 
 def main():
     load_dotenv()
@@ -20,169 +49,172 @@ def main():
         'walletAddress': config.owner_wallet_address,
         'privateKey': config.private_key,
         'options':{'account_id': config.account_id},
-        'verbose': True,
+        # request/response dumps are expensive for large responses, enable them with REYA_VERBOSE=1
+        'verbose': os.getenv('REYA_VERBOSE') == '1',
     })
     symbol = 'SOL/RUSD:RUSD'  # market symbol
 
     ORDER_PLACEMENT = True
     AMOUNT = 0.1
 
-    # load markets
-    exchange.load_markets()
-
-    # # Fetch the latest ticker for the symbol
-    # print(f"Fetching ticker for {symbol}")
-    ticker = exchange.fetch_ticker(symbol)
-    print(f"{symbol} price: {ticker['last']}")
-    funding = exchange.fetch_funding_rate(symbol)
-    print(
-        f"funding rate for {funding['symbol']}: {funding['info']['fundingRate']}@{funding['interval']} , lastTime: {funding['fundingDatetime']}, yearly: {funding['info']['fundingRateAnnualized']}%")
-    funding = exchange.fetch_funding_rate("BTC/RUSD:RUSD")
-    print(
-        f"funding rate for {funding['info']['symbol']}: {funding['info']['fundingRate']}@{funding['interval']} , lastTime: {funding['fundingDatetime']}, yearly: {funding['info']['fundingRateAnnualized']}%")
-    position = exchange.fetch_position(symbol)
-    print(f"{position['info']['unrealisedPnl']} {position['info']['curRealisedPnl']} {position['info']['size']}")
-    print(exchange.fetch_open_orders(symbol))
-
-    # test sell
-
-    #
-    # # Fetch all open orders for the symbol
-    # print(f"Fetching open orders for {symbol}")
-    # orders = exchange.fetch_open_orders(symbol)
-    #
-    # # Loop through each open order and cancel it
-    # for order in orders:
-    #     print(f"Canceling order {order['id']} for {order['symbol']}")
-    #     exchange.cancel_order(order["id"])
-    #
-    # # Fetch OHLCV (candlestick) data
-    # print(f"Fetching OHLCV data for {symbol}")
-    # print(exchange.fetch_ohlcv(symbol))
-
-    # Fetch balance
-    # print("Fetching account balance")
-    # print(exchange.fetch_balance())
-
-    # Fetch current open position
-    # print(f"Fetching position for {symbol}")
-    # print(exchange.fetch_position(symbol))
-
-    # Fetch all currently open orders
-    # print("Fetching all open orders")
-    # print(exchange.fetch_open_orders())
-
-    if ORDER_PLACEMENT:
-        # Create a new limit order
-        print(f"Creating LIMIT BUY order for {symbol}")
-        print(exchange.create_order(symbol, EOrderType.LIMIT.value, EOrderSide.BUY.value, AMOUNT, ticker['last'] * 0.5))
-    #
-    # # Fetch currencies
-    # print("Fetching currencies")
-    # print(exchange.fetch_currencies())
-
-    # Fetch markets
-    # print("Fetching markets")
-    # print(exchange.fetch_markets())
-    #
-    # # Fetch funding rate
-    # print(f"Fetching funding rate for {symbol}")
-    # print(exchange.fetch_funding_rate(symbol))
-
-    if ORDER_PLACEMENT:
-        # Create another limit order
-        print(f"Creating another LIMIT BUY order for {symbol}")
-        result = exchange.create_order(symbol, EOrderType.LIMIT.value, EOrderSide.BUY.value, AMOUNT, ticker['last'] * 0.5)
-
-    # Fetch updated balance
-    print("Fetching updated balance after order placement")
-    print(exchange.fetch_balance())
-
-    if ORDER_PLACEMENT:
-        # Fetch details of created order
-        print(f"Fetching details for order {result['id']}")
-        print(exchange.fetch_order(result['id'], symbol))
-
-    # Fetch all orders
-    # print(f"Fetching all orders for {symbol}")
-    # print(exchange.fetch_orders(symbol))
-
-    # Cancel all fetched orders
-    print(f"Canceling all fetched orders for {symbol}")
-    orders = exchange.fetch_orders(symbol)
-    for order in orders:
-        print(f"Canceling order {order['id']}")
-        result = exchange.cancel_order(order["id"])
-        print(result)
-
-    # Fetch open orders again
-    print("Fetching open orders after cancellations")
-    print(exchange.fetch_open_orders())
-
-    # Fetch closed orders
-    print("Fetching closed orders")
-    print(exchange.fetch_closed_orders())
-
-    # Fetch canceled + closed orders (not supported right now)
-    #print("Fetching canceled and closed orders")
-    #print(exchange.fetch_canceled_and_closed_orders())
-    #
-    # # Fetch trade history
-    # print(f"Fetching trades for {symbol}")
-    # print(exchange.fetch_trades(symbol))
-    #
-    # # Fetch my trades
-    # print("Fetching my trades")
-    # print(exchange.fetch_my_trades())
-    #
-    # # Fetch current position
-    # print(f"Fetching current position for {symbol}")
-    # print(exchange.fetch_position(symbol))
-
-    # Set leverage (not supported right now)
-    #print(f"Setting leverage for {symbol}")
-    #print(exchange.set_leverage(symbol))
-
-    if ORDER_PLACEMENT:
-        # Create market and limit orders
-        print(f"Creating MARKET BUY order for {symbol}")
-        print(exchange.create_market_order(symbol, EOrderSide.BUY.value, AMOUNT, ticker['last'] * 1.01))
-
-        print(f"Creating LIMIT BUY order for {symbol}")
-        print(exchange.create_limit_order(symbol, EOrderSide.BUY.value, AMOUNT, ticker['last'] * 0.5))
-
-    # Fetch leverage
-    # print(f"Fetching leverage for {symbol}")
-    # print(exchange.fetch_leverage(symbol))
-
-    if ORDER_PLACEMENT:
-        # Create TP order
-        print(f"Creating TAKE PROFIT MARKET SELL order for {symbol}")
-        print(exchange.create_order(
-            symbol,
-            EOrderType.MARKET.value,
-            EOrderSide.SELL.value,
-            AMOUNT,
-            ticker['last'] * 1.01,
-            params={'takeProfitPrice': '250', 'reduceOnly': True}
-        ))
-
-        # Create SL order
-        print(f"Creating STOP LOSS MARKET SELL order for {symbol}")
-        print(exchange.create_order(
-            symbol,
-            EOrderType.MARKET.value,
-            EOrderSide.SELL.value,
-            AMOUNT,
-            ticker['last'] * 1.01,
-            params={'stopLossPrice': '100', 'reduceOnly': True}
-        ))
-
-    # Fetch accounts
-    # print("Fetching accounts")
-    # print(exchange.fetch_accounts())
-
-    exchange.close()
+    # close the websocket and the background loop even when a step fails halfway
+    try:
+        # load markets and leverages, markets come from the opt-in disk cache when a recent run left one
+        markets_restored = restore_markets(exchange)
+        exchange.preload()
+        if not markets_restored:
+            store_markets(exchange)
+        if ORDER_PLACEMENT:
+            # order states are pushed over the websocket, fetch_order reads them from there
+            exchange.watch_order_changes()
+
+        # # Fetch the latest ticker for the symbol
+        # print(f"Fetching ticker for {symbol}")
+        # the read-only fetches don't depend on each other, run them concurrently
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            ticker_future = pool.submit(exchange.fetch_ticker, symbol)
+            funding_future = pool.submit(exchange.fetch_funding_rate, symbol)
+            btc_funding_future = pool.submit(exchange.fetch_funding_rate, "BTC/RUSD:RUSD")
+            position_future = pool.submit(exchange.fetch_position, symbol)
+            open_orders_future = pool.submit(exchange.fetch_open_orders, symbol)
+
+        ticker = ticker_future.result()
+        print(f"{symbol} price: {ticker['last']}")
+        # order prices derived from the ticker once: resting bids far below and marketable prices just above the last price
+        limit_price = ticker['last'] * 0.5
+        market_price = ticker['last'] * 1.01
+        funding = funding_future.result()
+        print(
+            f"funding rate for {funding['symbol']}: {funding['info']['fundingRate']}@{funding['interval']} , lastTime: {funding['fundingDatetime']}, yearly: {funding['info']['fundingRateAnnualized']}%")
+        funding = btc_funding_future.result()
+        print(
+            f"funding rate for {funding['info']['symbol']}: {funding['info']['fundingRate']}@{funding['interval']} , lastTime: {funding['fundingDatetime']}, yearly: {funding['info']['fundingRateAnnualized']}%")
+        position = position_future.result()
+        print(f"{position['info']['unrealisedPnl']} {position['info']['curRealisedPnl']} {position['info']['size']}")
+        print(open_orders_future.result())
+
+        # test sell
+
+        #
+        # # Fetch all open orders for the symbol
+        # print(f"Fetching open orders for {symbol}")
+        # orders = exchange.fetch_open_orders(symbol)
+        #
+        # # Loop through each open order and cancel it
+        # for order in orders:
+        #     print(f"Canceling order {order['id']} for {order['symbol']}")
+        #     exchange.cancel_order(order["id"])
+        #
+        # # Fetch OHLCV (candlestick) data
+        # print(f"Fetching OHLCV data for {symbol}")
+        # print(exchange.fetch_ohlcv(symbol))
+
+        # Fetch balance
+        # print("Fetching account balance")
+        # print(exchange.fetch_balance())
+
+        # Fetch current open position
+        # print(f"Fetching position for {symbol}")
+        # print(exchange.fetch_position(symbol))
+
+        # Fetch all currently open orders
+        # print("Fetching all open orders")
+        # print(exchange.fetch_open_orders())
+
+        if ORDER_PLACEMENT:
+            # Create two limit orders in one call
+            print(f"Creating two LIMIT BUY orders for {symbol}")
+            limit_order = {'symbol': symbol, 'type': LIMIT, 'side': BUY, 'amount': AMOUNT, 'price': limit_price}
+            first, result = exchange.create_orders([limit_order, dict(limit_order)])
+            print(first)
+        #
+        # # Fetch currencies
+        # print("Fetching currencies")
+        # print(exchange.fetch_currencies())
+
+        # Fetch markets
+        # print("Fetching markets")
+        # print(exchange.fetch_markets())
+        #
+        # # Fetch funding rate
+        # print(f"Fetching funding rate for {symbol}")
+        # print(exchange.fetch_funding_rate(symbol))
+
+        # Fetch updated balance
+        print("Fetching updated balance after order placement")
+        print(exchange.fetch_balance())
+
+        if ORDER_PLACEMENT:
+            # Fetch details of created order
+            print(f"Fetching details for order {result['id']}")
+            print(exchange.fetch_order(result['id'], symbol))
+
+        # Fetch all orders
+        # print(f"Fetching all orders for {symbol}")
+        # print(exchange.fetch_orders(symbol))
+
+        # Cancel all fetched orders
+        print(f"Canceling all fetched orders for {symbol}")
+        orders = exchange.fetch_orders(symbol)
+        order_ids = [order['id'] for order in orders]
+        for order_id, result in zip(order_ids, exchange.cancel_orders(order_ids, symbol)):
+            print(f"Canceled order {order_id}: {result}")
+
+        # Fetch open orders again
+        print("Fetching open orders after cancellations")
+        print(f"open orders remaining: {exchange.fetch_open_orders_count()}")
+
+        # Fetch closed orders
+        print("Fetching closed orders")
+        print(exchange.fetch_closed_orders())
+
+        # Fetch canceled + closed orders (not supported right now)
+        #print("Fetching canceled and closed orders")
+        #print(exchange.fetch_canceled_and_closed_orders())
+        #
+        # # Fetch trade history
+        # print(f"Fetching trades for {symbol}")
+        # print(exchange.fetch_trades(symbol))
+        #
+        # # Fetch my trades
+        # print("Fetching my trades")
+        # print(exchange.fetch_my_trades())
+        #
+        # # Fetch current position
+        # print(f"Fetching current position for {symbol}")
+        # print(exchange.fetch_position(symbol))
+
+        # Set leverage (not supported right now)
+        #print(f"Setting leverage for {symbol}")
+        #print(exchange.set_leverage(symbol))
+
+        if ORDER_PLACEMENT:
+            # Create market and limit orders
+            print(f"Creating MARKET BUY order for {symbol}")
+            print(exchange.create_market_order(symbol, BUY, AMOUNT, market_price))
+
+            print(f"Creating LIMIT BUY order for {symbol}")
+            print(exchange.create_limit_order(symbol, BUY, AMOUNT, limit_price))
+
+        # Fetch leverage
+        # print(f"Fetching leverage for {symbol}")
+        # print(exchange.fetch_leverage(symbol))
+
+        if ORDER_PLACEMENT:
+            # Create TP and SL orders in one call
+            print(f"Creating TAKE PROFIT and STOP LOSS MARKET SELL orders for {symbol}")
+            trigger_order = {'symbol': symbol, 'type': MARKET, 'side': SELL, 'amount': AMOUNT, 'price': market_price}
+            for created in exchange.create_orders([
+                {**trigger_order, 'params': {'takeProfitPrice': '250', 'reduceOnly': True}},
+                {**trigger_order, 'params': {'stopLossPrice': '100', 'reduceOnly': True}},
+            ]):
+                print(created)
+
+        # Fetch accounts
+        # print("Fetching accounts")
+        # print(exchange.fetch_accounts())
+    finally:
+        exchange.close()
 
 if __name__ == '__main__':
     main()
@@ -7,13 +7,48 @@ and message signatures for order cancellation.
 
 import json
 from decimal import Decimal
+from typing import Callable, Optional
 
 from eth_abi import encode
 from eth_account import Account
-from eth_account.messages import encode_defunct
+from eth_account.messages import SignableMessage, encode_defunct
+
+# private helpers of eth-account, None makes sign_raw_order fall back to sign_typed_data if they move
+hash_domain: Optional[Callable[..., bytes]]
+hash_eip712_message: Optional[Callable[..., bytes]]
+try:
+    from eth_account._utils.encode_typed_data.encoding_and_hashing import hash_domain, hash_eip712_message
+except ImportError:
+    hash_domain = None
+    hash_eip712_message = None
 
 from sdk.reya_rest_api.config import TradingConfig
 
+# EIP-712 message types for Orders Gateway orders (conditional order format), identical for every order
+CONDITIONAL_ORDER_TYPES = {
+    "ConditionalOrder": [
+        {"name": "verifyingChainId", "type": "uint256"},
+        {"name": "deadline", "type": "uint256"},
+        {"name": "order", "type": "ConditionalOrderDetails"},
+    ],
+    "ConditionalOrderDetails": [
+        {"name": "accountId", "type": "uint128"},
+        {"name": "marketId", "type": "uint128"},
+        {"name": "exchangeId", "type": "uint128"},
+        {"name": "counterpartyAccountIds", "type": "uint128[]"},
+        {"name": "orderType", "type": "uint8"},
+        {"name": "inputs", "type": "bytes"},
+        {"name": "signer", "type": "address"},
+        {"name": "nonce", "type": "uint256"},
+    ],
+}
+
+
+def _to_0x_hex(value: bytes) -> str:
+    """Hex-encode once; HexBytes.hex() includes the 0x prefix on older hexbytes versions, bytes.hex() never does."""
+    encoded = value.hex()
+    return encoded if encoded.startswith("0x") else f"0x{encoded}"
+
 
 class SignatureGenerator:
     """Generate signatures for Reya Trading API requests."""
@@ -32,8 +67,20 @@ class SignatureGenerator:
         if not self._private_key:
             raise ValueError("Private key is required for signing")
 
-        # Calculate signer wallet address from private key
-        self._signer_wallet_address: str = str(Account.from_key(self._private_key).address)
+        # Parse the private key once; signing with the raw key string would re-derive the key pair per call
+        self._account = Account.from_key(self._private_key)
+        self._signer_wallet_address: str = str(self._account.address)
+
+        # EIP-712 domain is fixed for the lifetime of the configuration
+        self._order_domain = {
+            "name": "Reya",
+            "version": "1",
+            "verifyingContract": self.config.default_orders_gateway_address,
+        }
+        # its hash is the EIP-712 header of every order signature, computed once instead of per order
+        self._order_domain_hash: Optional[bytes] = None
+        if hash_domain is not None:
+            self._order_domain_hash = hash_domain(self._order_domain)
 
     @property
     def signer_wallet_address(self) -> str:
@@ -61,7 +108,7 @@ class SignatureGenerator:
         signed_qty = qty if is_buy else -qty
 
         encoded = encode(["int256", "uint256"], [scaler(signed_qty), scaler(limit_px)])
-        return encoded.hex() if encoded.hex().startswith("0x") else f"0x{encoded.hex()}"
+        return _to_0x_hex(encoded)
 
     def encode_inputs_trigger_order(
         self,
@@ -75,7 +122,7 @@ class SignatureGenerator:
             ["bool", "uint256", "uint256"],
             [bool(is_buy), scaler(trigger_px), scaler(limit_px)],
         )
-        return encoded.hex() if encoded.hex().startswith("0x") else f"0x{encoded.hex()}"
+        return _to_0x_hex(encoded)
 
     def create_orders_gateway_nonce(
         self,
@@ -123,32 +170,6 @@ class SignatureGenerator:
         Returns:
             Hex-encoded signature
         """
-        # Define EIP-712 domain
-        domain = {
-            "name": "Reya",
-            "version": "1",
-            "verifyingContract": self.config.default_orders_gateway_address,
-        }
-
-        # Define the message types for EIP-712 (conditional order format)
-        types = {
-            "ConditionalOrder": [
-                {"name": "verifyingChainId", "type": "uint256"},
-                {"name": "deadline", "type": "uint256"},
-                {"name": "order", "type": "ConditionalOrderDetails"},
-            ],
-            "ConditionalOrderDetails": [
-                {"name": "accountId", "type": "uint128"},
-                {"name": "marketId", "type": "uint128"},
-                {"name": "exchangeId", "type": "uint128"},
-                {"name": "counterpartyAccountIds", "type": "uint128[]"},
-                {"name": "orderType", "type": "uint8"},
-                {"name": "inputs", "type": "bytes"},
-                {"name": "signer", "type": "address"},
-                {"name": "nonce", "type": "uint256"},
-            ],
-        }
-
         # Create the message to sign
         message = {
             "verifyingChainId": self._chain_id,
@@ -166,13 +187,16 @@ class SignatureGenerator:
         }
 
         # Sign the message using the correct eth-account format
-        signed_message = Account.sign_typed_data(self._private_key, domain, types, message)
+        if self._order_domain_hash is not None and hash_eip712_message is not None:
+            # same SignableMessage sign_typed_data builds, with the cached domain hash
+            signable_message = SignableMessage(
+                b"\x01", self._order_domain_hash, hash_eip712_message(CONDITIONAL_ORDER_TYPES, message)
+            )
+            signed_message = self._account.sign_message(signable_message)
+        else:
+            signed_message = self._account.sign_typed_data(self._order_domain, CONDITIONAL_ORDER_TYPES, message)
 
-        return (
-            signed_message.signature.hex()
-            if signed_message.signature.hex().startswith("0x")
-            else f"0x{signed_message.signature.hex()}"
-        )
+        return _to_0x_hex(signed_message.signature)
 
     def sign_cancel_order(self, order_id: str) -> str:
         """
@@ -198,10 +222,6 @@ class SignatureGenerator:
         signable_message = encode_defunct(text=message_str)
 
         # Sign the message
-        signed_message = Account.sign_message(signable_message, private_key=self._private_key)
+        signed_message = self._account.sign_message(signable_message)
 
-        return (
-            signed_message.signature.hex()
-            if signed_message.signature.hex().startswith("0x")
-            else f"0x{signed_message.signature.hex()}"
-        )
+        return _to_0x_hex(signed_message.signature)
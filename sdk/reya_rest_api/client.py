@@ -216,7 +216,7 @@ class ReyaTradingClient:
             raise ValueError("Account ID is required for order signing")
 
         nonce = self._signature_generator.create_orders_gateway_nonce(
-            self.config.account_id, market_id, int(time.time_ns() / 1000000)
+            self.config.account_id, market_id, time.time_ns() // 1_000_000
         )
 
         inputs = self._signature_generator.encode_inputs_limit_order(
@@ -307,7 +307,7 @@ class ReyaTradingClient:
         )
 
         nonce = self._signature_generator.create_orders_gateway_nonce(
-            self.config.account_id, market_id, int(time.time_ns() / 1000000)
+            self.config.account_id, market_id, time.time_ns() // 1_000_000
         )
 
         inputs = self._signature_generator.encode_inputs_trigger_order(